@@ -176,6 +176,11 @@ if [ "$REMOVE_ALL" = true ]; then
             rm -rf "$USER_HOME/.local/share/speaker" || true
             echo "Removed directory $USER_HOME/.local/share/speaker"
         fi
+        # Remove cache dir (page/summary cache and the .env snapshot with API keys)
+        if [ -d "$USER_HOME/.cache/speaker" ]; then
+            rm -rf "$USER_HOME/.cache/speaker" || true
+            echo "Removed directory $USER_HOME/.cache/speaker"
+        fi
     done
 else
     # Targeted removal for the selected user
@@ -208,6 +213,18 @@ printf "\\n${YELLOW}Step 2: Removing application directory...\\n${NC}"
     else
         echo "Directory $INSTALL_DIR does not exist. Skipping."
     fi
+
+    # Cache dir: page/summary cache and the .env snapshot with API keys.
+    # XDG_CACHE_HOME only applies when removing for the current user.
+    if [ "$TARGET_HOME" = "$HOME" ] && [ -n "$XDG_CACHE_HOME" ]; then
+        CACHE_DIR="$XDG_CACHE_HOME/speaker"
+    else
+        CACHE_DIR="$TARGET_HOME/.cache/speaker"
+    fi
+    if [ -d "$CACHE_DIR" ]; then
+        rm -rf "$CACHE_DIR"
+        echo "Removed directory $CACHE_DIR"
+    fi
 fi
 
 # --- Step 3: Remove Man Page (conditional on root privileges) ---
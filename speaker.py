@@ -1,63 +1,261 @@
 #!/usr/bin/env python3
 import argparse
-import base64
+import atexit
+import binascii
+import hashlib
+import io
+import itertools
 import json
 import os
+import queue
 import re
+import statistics
+import sqlite3
 import subprocess
 import sys
-import tempfile
-from urllib.parse import urlparse
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
 
-import requests
-from dotenv import load_dotenv
+try:
+    import orjson
+except ImportError:  # optional: fall back to the standard library parser
+    orjson = None
 
 # --- Configuration and Constants ---
-# Determine the app directory and load the .env file
+# Determine the app directory; the .env file is loaded in main() once arguments are parsed
 APP_DIR = os.path.dirname(os.path.realpath(__file__))
 dotenv_path = os.path.join(APP_DIR, ".env")
-load_dotenv(dotenv_path=dotenv_path)
 
 JINA_READER_URL = "https://r.jina.ai/"
 
+# http(s) URL with a host and no whitespace (the only URLs Jina Reader can fetch)
+_URL_RE = re.compile(r'^https?://[^\s/$.?#][^\s]*$', re.IGNORECASE)
+
+# Lifetime of cached Jina Reader pages and LLM summaries (seconds)
+_PAGE_CACHE_TTL = 60 * 60
+_LLM_CACHE_TTL = 30 * 24 * 60 * 60
+# Pages with an ETag or Last-Modified header are kept this long for conditional revalidation
+_PAGE_REVALIDATE_TTL = 7 * 24 * 60 * 60
+# Everything except letters and digits is ignored when keying cached summaries
+_CACHE_NORMALIZE_RE = re.compile(r'[\W_]+')
+
+# Characters normalized by clean_text() in a single str.translate() pass
+_CLEAN_TRANS_TABLE = str.maketrans({
+    '\u201c': '"',  # “
+    '\u201d': '"',  # ”
+    '\u2018': "'",  # ‘
+    '\u2019': "'",  # ’
+    '\u2013': '-',  # – (en-dash)
+    '\u2014': '-',  # — (em-dash)
+    '\u00a0': ' ',  # non-breaking space
+})
+_WS_RE = re.compile(r'\s+')
+
+# Whole lines that are page furniture (cookie banners, newsletter/share prompts, ad labels) and
+# are dropped before summarizing. Anchored to the full line, and cookie notices to their banner
+# phrasing ("...to improve your experience", "by continuing..."), so article sentences that merely
+# mention cookies or subscriptions are kept; longer lines are never dropped.
+_BOILERPLATE_RE = re.compile(
+    r'^\W*(?:'
+    r'(?:we|this (?:site|website)) uses? cookies(?: and similar technologies)?'
+    r'(?:\W+(?:to (?:improve|enhance|personali[sz]e|give you|provide|ensure|analy[sz]e)'
+    r'|for (?:analytics|advertising|marketing)|by (?:continuing|using))\b.*)?'
+    r'|by (?:continuing to (?:use|browse)|using) (?:this|our) (?:site|website)\b.*\bcookies?\b.*'
+    r'|(?:ta strona|strona|serwis) (?:używa|wykorzystuje) (?:plików |pliki )?cookies?'
+    r'(?:\W+(?:w celu|aby|by|do celów|korzystając)\b.*)?'
+    r'|korzystając z(?:e)? (?:strony|serwisu)\b.*\bcookies?\b.*'
+    r'|accept(?: all)? cookies|akceptuj(?: wszystkie)?(?: pliki)? cookies?'
+    r'|(?:subscribe|sign up)(?: to| for)?(?: our)? newsletter|zapisz się do newslettera'
+    r'|read more|share(?: this)?(?: article| post)?|advertisement|related articles?|sign up|log in|subscribe'
+    r'|czytaj (?:więcej|też|także)|zobacz (?:też|także|więcej)|reklama|udostępnij|subskrybuj|zaloguj się'
+    r')\W*$',
+    re.IGNORECASE)
+_BOILERPLATE_MAX_LEN = 200
+
+# Sentence boundaries used to pipeline TTS synthesis with playback and to split long texts
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+# Number of sentences synthesized in the background ahead of playback
+_TTS_WORKERS = 3
+# Google Cloud TTS voice (REST and gRPC) and audio settings; the player expects MP3
+_TTS_VOICE = {"languageCode": "pl-PL", "name": "pl-PL-Wavenet-A"}
+_TTS_AUDIO_CONFIG = {"audioEncoding": "MP3"}
+
+# Long inputs (~6000 tokens at ~4 characters per token) are summarized in ~2000-token parts,
+# a few at a time, and the partial summaries are then combined
+_MAP_REDUCE_THRESHOLD = 24000
+_MAP_REDUCE_CHUNK_CHARS = 8000
+_MAP_REDUCE_WORKERS = 4
+
+# gRPC Cloud TTS client, created on first use when google-cloud-texttospeech is installed
+# (False once creating it failed)
+_TTS_GRPC_CLIENT = None
+_TTS_GRPC_LOCK = threading.Lock()
+
+# Shared HTTP session, created on first use (see _get_session)
+# (connect, read) timeouts: an unreachable host fails within seconds, a slow but working one can still answer
+_CONNECT_TIMEOUT = 3.05
+# For streamed responses the read timeout bounds each gap between chunks; the first gap covers
+# prefill and thinking time, which on long inputs and pro models can take as long as a whole answer
+_LLM_TIMEOUT = (_CONNECT_TIMEOUT, 45)
+_HTTP_TIMEOUT = (_CONNECT_TIMEOUT, 30)
+# Longest Retry-After (seconds) honoured by the automatic retries
+_MAX_RETRY_AFTER = 5
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+# Request durations (seconds) per tag, reported on exit when SPEAKER_PROFILE is set
+_LAT = defaultdict(list)
+
+
+def _env_flag(name: str) -> bool:
+    """Return True if the on/off variable `name` is set to anything other than "" or "0"."""
+    return os.getenv(name, "").strip() not in ("", "0")
+
+
+def _make_http_adapter():
+    """Return a pooled, retrying HTTPAdapter whose sockets use TCP_NODELAY and SO_KEEPALIVE, so small
+    request bodies are not Nagle-delayed and idle pooled connections are kept alive by the kernel."""
+    import socket
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection
+    from urllib3.exceptions import MaxRetryError
+    from urllib3.util import Retry
+
+    class KeepAliveAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs):
+            # default_socket_options already holds TCP_NODELAY
+            kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            ]
+            super().init_poolmanager(*args, **kwargs)
+
+    class ShortRetryAfterRetry(Retry):
+        def increment(self, method=None, url=None, response=None, *args, **kwargs):
+            # A long Retry-After (typically an exhausted quota) is better spent on the next model
+            if response is not None and (self.get_retry_after(response) or 0) > _MAX_RETRY_AFTER:
+                raise MaxRetryError(kwargs.get("_pool"), url, "Retry-After too long")
+            return super().increment(method, url, response, *args, **kwargs)
+
+    # Retry transient failures (POST included: summaries and TTS requests have no side effects)
+    # on the same pooled connection before falling back to another model; the final response
+    # is returned (not raised) so callers still report its status. Read timeouts are not
+    # retried: a hung server would otherwise cost several full read timeouts, and the request
+    # may already have been processed (and billed).
+    retries = ShortRetryAfterRetry(total=2, read=False, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                                   allowed_methods=["GET", "HEAD", "POST"], respect_retry_after_header=True,
+                                   raise_on_status=False)
+    return KeepAliveAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+
+
+def _get_session():
+    """Return the shared HTTP session. It keeps TCP+TLS connections alive between calls to the
+    same host (e.g. Gemini summarization followed by Google TTS) instead of a new handshake per
+    request. `requests` is imported here so that --help and argument errors do not pay for it.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            session = requests.Session()
+            adapter = _make_http_adapter()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSION = session
+    return _SESSION
+
+
+@contextmanager
+def _timed(tag: str):
+    """Records how long the block takes under `tag` (also when it raises)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _LAT[tag].append(time.perf_counter() - start)
+
+
+def _print_latency_report():
+    """Prints count, P50 and P95 of the recorded request durations to stderr."""
+    if not _LAT:
+        return
+    print("\n--- Latency (ms): count / P50 / P95 ---", file=sys.stderr)
+    for tag, durations in sorted(_LAT.items()):
+        if len(durations) > 1:
+            cuts = statistics.quantiles(durations, n=20, method="inclusive")
+            p50, p95 = cuts[9], cuts[18]
+        else:
+            p50 = p95 = durations[0]
+        print(f"{tag}: {len(durations)} / {p50 * 1000:.0f} / {p95 * 1000:.0f}", file=sys.stderr)
+
+
+def _retry_after_note(response) -> str:
+    """Return ' (Retry-After: ...)' when a failed response asked the client to back off."""
+    retry_after = response.headers.get("Retry-After")
+    return f" (Retry-After: {retry_after})" if retry_after else ""
+
+
+def _json_dumps(obj) -> bytes:
+    """Serializes a request body, using orjson when available."""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
+
+
+def _json_loads(data: bytes):
+    """Parses a response body, using orjson when available."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
 # --- LLM Logic (Summarization) ---
 
-def _call_gemini(text: str, api_key: str, model: str, target_lang: str | None = None) -> str | None:
-    """Sends a request to the Google Gemini API for a specific model.
-    If `target_lang` is provided, request that the summary be translated into that language
-    as part of the same operation (single-step summarize+translate).
-    """
-    print(f"Attempting to use Gemini for summarization (model: {model})...")
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
-    headers = {"Content-Type": "application/json"}
+# Map common language codes to full names for better LLM understanding
+_LANG_NAMES = {
+    "pl": "Polish", "en": "English", "es": "Spanish", "fr": "French",
+    "de": "German", "it": "Italian", "pt": "Portuguese", "ru": "Russian",
+    "ja": "Japanese", "zh": "Chinese", "ko": "Korean", "ar": "Arabic",
+    "hi": "Hindi", "nl": "Dutch", "sv": "Swedish", "no": "Norwegian",
+    "da": "Danish", "fi": "Finnish", "cs": "Czech", "tr": "Turkish"
+}
 
-    # Map common language codes to full names for better LLM understanding
-    lang_map = {
-        "pl": "Polish", "en": "English", "es": "Spanish", "fr": "French",
-        "de": "German", "it": "Italian", "pt": "Portuguese", "ru": "Russian",
-        "ja": "Japanese", "zh": "Chinese", "ko": "Korean", "ar": "Arabic",
-        "hi": "Hindi", "nl": "Dutch", "sv": "Swedish", "no": "Norwegian",
-        "da": "Danish", "fi": "Finnish", "cs": "Czech", "tr": "Turkish"
-    }
 
+def _language_name(lang: str) -> str:
+    """Convert a language code to its full name if it's a known code."""
+    return _LANG_NAMES.get(lang.lower(), lang)
+
+
+def _gemini_summary_payload(text: str, target_lang: str | None) -> dict:
+    """Builds the Gemini request body for a summary (shared by the plain and streaming calls)."""
     if target_lang:
-        # Convert language code to full name if it's a known code
-        lang_full = lang_map.get(target_lang.lower(), target_lang)
+        lang_full = _language_name(target_lang)
         prompt = (f"Summarize the following text and translate the summary into {lang_full}. "
                   f"Keep the summary concise (5-7 sentences) and focus on the most important information. "
                   f"Reply ONLY with the {lang_full} translation of the summary, nothing else. Text:\n\n{text}")
     else:
         prompt = (f"Summarize the following text in a maximum of 5-7 sentences. "
                   f"Focus on the most important information and reply in the same language as the input. Text to summarize:\n\n{text}")
-    data = {"contents": [{"parts": [{"text": prompt}]}]}
+    return {"contents": [{"parts": [{"text": prompt}]}]}
+
+def _call_gemini(text: str, api_key: str, model: str, target_lang: str | None = None) -> str | None:
+    """Sends a request to the Google Gemini API for a specific model.
+    If `target_lang` is provided, request that the summary be translated into that language
+    as part of the same operation (single-step summarize+translate).
+    """
+    import requests
+
+    print(f"Attempting to use Gemini for summarization (model: {model})...")
+    url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
+    headers = {"Content-Type": "application/json"}
+    data = _gemini_summary_payload(text, target_lang)
 
     try:
-        response = requests.post(url, headers=headers, json=data, timeout=45)
+        with _timed(f"llm gemini:{model}"):
+            response = _get_session().post(url, headers=headers, data=_json_dumps(data), timeout=_LLM_TIMEOUT)
         # If non-2xx, surface response body for debugging
         if response.status_code != 200:
-            print(f"Gemini API returned {response.status_code}: {response.text}", file=sys.stderr)
+            print(f"Gemini API returned {response.status_code}{_retry_after_note(response)}: {response.text}", file=sys.stderr)
             return None
-        result = response.json()
+        result = _json_loads(response.content)
         # Safely navigate the returned JSON structure
         summary = result.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text", "")
         return summary.strip() if summary else None
@@ -96,14 +294,14 @@ def _get_llm_cache_path() -> str | None:
 def _read_llm_cache() -> tuple | None:
     """Read cached 'provider:model' from per-tty cache. Returns (provider, model) or None."""
     path = _get_llm_cache_path()
-    if not path or not os.path.exists(path):
+    if not path:
         return None
-    # Ensure TTY still exists; if not, remove stale cache
+    # Ensure TTY still exists; if not, remove stale cache (EAFP: no separate existence check)
     tty_id = _get_tty_id()
     if not tty_id or not os.path.exists(f"/dev/{tty_id}"):
         try:
-            os.remove(path)
-        except Exception:
+            os.unlink(path)
+        except OSError:
             pass
         return None
     try:
@@ -114,6 +312,7 @@ def _read_llm_cache() -> tuple | None:
                 return provider, model
             return None
     except Exception:
+        # Includes FileNotFoundError when nothing has been cached yet
         return None
 
 
@@ -128,34 +327,163 @@ def _write_llm_cache(provider: str, model: str):
         pass
 
 
+# --- Persistent response cache (SQLite) ---
+def _get_response_cache_path() -> str:
+    """Return the path of the on-disk cache for page fetches and summaries."""
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "speaker", "cache.db")
+
+
+def _cache_key(*parts: str) -> str:
+    """Content-addressed cache key: blake2b digest of all parts."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _normalize_for_cache(text: str) -> str:
+    """Reduce text to lowercase words so that re-cleaned copies of the same article
+    (whitespace, punctuation, quote style, case) map to the same cache key."""
+    return _CACHE_NORMALIZE_RE.sub(" ", text.casefold()).strip()
+
+
+def _cache_connect() -> sqlite3.Connection | None:
+    if os.getenv("SPEAKER_CACHE", "1") == "0":
+        return None
+    path = _get_response_cache_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=5)
+    conn.execute("CREATE TABLE IF NOT EXISTS kv (k TEXT PRIMARY KEY, v TEXT, exp INTEGER)")
+    return conn
+
+
+def _cache_get(key: str) -> str | None:
+    """Return the cached value for `key`, or None if missing, expired or the cache is disabled."""
+    try:
+        conn = _cache_connect()
+        if conn is None:
+            return None
+        with closing(conn):
+            row = conn.execute("SELECT v FROM kv WHERE k = ? AND exp > ?", (key, int(time.time()))).fetchone()
+        return row[0] if row else None
+    except Exception:
+        return None
+
+
+def _cache_put(key: str, value: str, ttl: int):
+    """Store `value` under `key` for `ttl` seconds, dropping expired entries."""
+    try:
+        conn = _cache_connect()
+        if conn is None:
+            return
+        now = int(time.time())
+        with closing(conn), conn:
+            conn.execute("DELETE FROM kv WHERE exp <= ?", (now,))
+            conn.execute("INSERT OR REPLACE INTO kv (k, v, exp) VALUES (?, ?, ?)", (key, value, now + ttl))
+    except Exception:
+        pass
+
+
+# --- .env loading ---
+def _get_env_snapshot_path() -> str:
+    """Return the path of the parsed .env snapshot (next to the response cache)."""
+    return os.path.join(os.path.dirname(_get_response_cache_path()), "env.json")
+
+
+def _load_env():
+    """Loads .env into os.environ without overriding variables that are already set.
+
+    The parsed values are kept in a JSON snapshot keyed by the file's path, mtime and size,
+    so python-dotenv is only imported and run after .env has changed. Files using ${VAR}
+    interpolation are parsed every time, since their values depend on the environment.
+    No snapshot is kept when SPEAKER_CACHE is "0" (in the environment or in .env).
+    """
+    try:
+        st = os.stat(dotenv_path)
+    except OSError:
+        return
+    stamp = [dotenv_path, st.st_mtime_ns, st.st_size]
+    snapshot_path = _get_env_snapshot_path()
+
+    values = None
+    if os.getenv("SPEAKER_CACHE") != "0":
+        try:
+            with open(snapshot_path, "rb") as f:
+                snapshot = _json_loads(f.read())
+            if snapshot["stamp"] == stamp:
+                values = snapshot["values"]
+        except Exception:
+            pass
+
+    parsed = values is None
+    if parsed:
+        from dotenv import dotenv_values
+        with open(dotenv_path, encoding="utf-8") as f:
+            content = f.read()
+        values = {k: v for k, v in dotenv_values(stream=io.StringIO(content)).items() if v is not None}
+
+    # SPEAKER_CACHE may be set in the environment or in .env itself
+    if os.environ.get("SPEAKER_CACHE", values.get("SPEAKER_CACHE", "1")) == "0":
+        # Also remove a snapshot written before the cache was disabled: it holds API keys
+        try:
+            os.unlink(snapshot_path)
+        except OSError:
+            pass
+    elif parsed and "${" not in content:
+        try:
+            # The snapshot holds API keys: create it private and replace it atomically
+            os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+            tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json_dumps({"stamp": stamp, "values": values}))
+            os.replace(tmp_path, snapshot_path)
+        except OSError:
+            pass
+
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+
+
+def _openai_summary_payload(text: str, model: str, target_lang: str | None) -> dict:
+    """Builds the Chat Completions request body for a summary (shared by the plain and streaming calls)."""
+    if target_lang:
+        lang_full = _language_name(target_lang)
+        system_prompt = (f"You are a helpful assistant that summarizes text concisely in 5-7 sentences and returns the summary "
+                         f"translated into {lang_full}. Reply ONLY with the {lang_full} summary, nothing else.")
+    else:
+        system_prompt = "You are a helpful assistant that summarizes text concisely in 5-7 sentences and reply in the same language as the user's input. Reply ONLY with the summary, nothing else."
+
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": text}
+    ]
+    return {"model": model, "messages": messages, "temperature": 0.3, "max_tokens": 500}
+
 def _call_openai(text: str, api_key: str, model: str, target_lang: str | None = None) -> str | None:
     """Sends a request to the OpenAI Chat Completions endpoint to summarize text.
     If `target_lang` is provided, instruct the model to translate the summary into that language
     as part of the same operation.
     """
+    import requests
+
     print(f"Attempting to use OpenAI ({model}) for summarization...")
     url = "https://api.openai.com/v1/chat/completions"
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {api_key}"
     }
-    if target_lang:
-        system_prompt = f"You are a helpful assistant that summarizes text concisely in 5-7 sentences and returns the summary translated into {target_lang}. Reply with the translation only."
-    else:
-        system_prompt = "You are a helpful assistant that summarizes text concisely in 5-7 sentences and reply in the same language as the user's input."
-
-    messages = [
-        {"role": "system", "content": system_prompt},
-        {"role": "user", "content": text}
-    ]
-    data = {"model": model, "messages": messages, "temperature": 0.3, "max_tokens": 500}
+    data = _openai_summary_payload(text, model, target_lang)
 
     try:
-        response = requests.post(url, headers=headers, json=data, timeout=45)
+        with _timed(f"llm openai:{model}"):
+            response = _get_session().post(url, headers=headers, data=_json_dumps(data), timeout=_LLM_TIMEOUT)
         if response.status_code != 200:
-            print(f"OpenAI API returned {response.status_code}: {response.text}", file=sys.stderr)
+            print(f"OpenAI API returned {response.status_code}{_retry_after_note(response)}: {response.text}", file=sys.stderr)
             return None
-        result = response.json()
+        result = _json_loads(response.content)
         # Chat completions v1 response: choices[0].message.content
         summary = result.get("choices", [{}])[0].get("message", {}).get("content", "")
         return summary.strip() if summary else None
@@ -167,271 +495,602 @@ def _call_openai(text: str, api_key: str, model: str, target_lang: str | None =
         return None
 
 
-def _translate_openai(text: str, api_key: str, model: str, target_lang: str) -> str | None:
-    """Translate text using OpenAI Chat Completions."""
-    print(f"Attempting to use OpenAI ({model}) for translation to {target_lang}...")
-    url = "https://api.openai.com/v1/chat/completions"
-    headers = {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
-    messages = [
-        {"role": "system", "content": f"You are a helpful translator. Translate the user's text into {target_lang} and reply with the translation only."},
-        {"role": "user", "content": text}
-    ]
-    data = {"model": model, "messages": messages, "temperature": 0.0, "max_tokens": 2000}
-    try:
-        response = requests.post(url, headers=headers, json=data, timeout=45)
-        if response.status_code != 200:
-            print(f"OpenAI API returned {response.status_code}: {response.text}", file=sys.stderr)
-            return None
-        result = response.json()
-        translation = result.get("choices", [{}])[0].get("message", {}).get("content", "")
-        return translation.strip() if translation else None
-    except Exception as e:
-        print(f"OpenAI translation error: {e}", file=sys.stderr)
-        return None
-
-
-def _translate_gemini(text: str, api_key: str, model: str, target_lang: str) -> str | None:
-    """Translate text using Gemini by sending a translation prompt."""
-    print(f"Attempting to use Gemini ({model}) for translation to {target_lang}...")
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
-    headers = {"Content-Type": "application/json"}
-    prompt = f"Translate the following text into {target_lang}. Reply with the translation only. Text:\n\n{text}"
-    data = {"contents": [{"parts": [{"text": prompt}]}]}
-    try:
-        response = requests.post(url, headers=headers, json=data, timeout=45)
-        if response.status_code != 200:
-            print(f"Gemini API returned {response.status_code}: {response.text}", file=sys.stderr)
-            return None
-        result = response.json()
-        translation = result.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text", "")
-        return translation.strip() if translation else None
-    except Exception as e:
-        print(f"Gemini translation error: {e}", file=sys.stderr)
-        return None
-
-
-def _call_deepseek(text: str, api_key: str, model: str) -> str | None:
+def _call_deepseek(text: str, api_key: str, model: str, target_lang: str | None = None) -> str | None:
     """Sends a request to the DeepSeek API."""
     print(f"Attempting to use DeepSeek ({model}) for summarization...")
     # Placeholder for DeepSeek logic
     print("DeepSeek logic is not yet implemented.", file=sys.stderr)
     return None
     
-def _call_ollama(text: str, base_url: str, model: str) -> str | None:
+def _call_ollama(text: str, base_url: str, model: str, target_lang: str | None = None) -> str | None:
     """Sends a request to a local Ollama server."""
     print(f"Attempting to use Ollama ({model}) for summarization...")
     # Placeholder for Ollama logic
     print("Ollama logic is not yet implemented.", file=sys.stderr)
     return None
 
+def _iter_sse_data(response):
+    """Yields the decoded JSON payload of each `data:` line of a server-sent events response."""
+    for line in response.iter_lines():
+        if not line.startswith(b"data:"):
+            continue
+        payload = line[5:].strip()
+        if payload == b"[DONE]":
+            break
+        yield _json_loads(payload)
+
+def _stream_gemini(text: str, api_key: str, model: str, target_lang: str | None = None):
+    """Streams a summary from Gemini (`:streamGenerateContent` as SSE), yielding text fragments.
+    Errors are raised, not printed: the caller decides whether they happened before or after
+    the first fragment.
+    """
+    print(f"Attempting to use Gemini for summarization (model: {model}, streaming)...")
+    url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:streamGenerateContent?alt=sse&key={api_key}"
+    headers = {"Content-Type": "application/json"}
+    data = _gemini_summary_payload(text, target_lang)
+    # Timed up to the response headers only: the rest of the stream is paced by the reader
+    with _timed(f"llm gemini:{model} (stream start)"):
+        response = _get_session().post(url, headers=headers, data=_json_dumps(data), timeout=_LLM_TIMEOUT, stream=True)
+    with response:
+        if response.status_code != 200:
+            raise RuntimeError(f"Gemini API returned {response.status_code}{_retry_after_note(response)}: {response.text}")
+        for event in _iter_sse_data(response):
+            parts = (event.get("candidates") or [{}])[0].get("content", {}).get("parts") or [{}]
+            fragment = "".join(part.get("text", "") for part in parts)
+            if fragment:
+                yield fragment
+
+def _stream_openai(text: str, api_key: str, model: str, target_lang: str | None = None):
+    """Streams a summary from OpenAI Chat Completions (`"stream": true`), yielding text fragments.
+    Errors are raised, not printed (see _stream_gemini).
+    """
+    print(f"Attempting to use OpenAI ({model}) for summarization (streaming)...")
+    url = "https://api.openai.com/v1/chat/completions"
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}"
+    }
+    data = _openai_summary_payload(text, model, target_lang)
+    data["stream"] = True
+    # Timed up to the response headers only: the rest of the stream is paced by the reader
+    with _timed(f"llm openai:{model} (stream start)"):
+        response = _get_session().post(url, headers=headers, data=_json_dumps(data), timeout=_LLM_TIMEOUT, stream=True)
+    with response:
+        if response.status_code != 200:
+            raise RuntimeError(f"OpenAI API returned {response.status_code}{_retry_after_note(response)}: {response.text}")
+        for event in _iter_sse_data(response):
+            # The final chunk may carry usage data with an empty `choices` list
+            fragment = (event.get("choices") or [{}])[0].get("delta", {}).get("content")
+            if fragment:
+                yield fragment
+
+# Provider table: name -> (summarize function, env var with the API key or base URL,
+# placeholder value meaning "not configured", model list env vars in priority order, default model).
+# Values are looked up at call time because .env is only loaded in main().
+_PROVIDERS = {
+    "gemini": (_call_gemini, "GEMINI_API_KEY", "Your_Gemini_API_Key", ("GEMINI_MODELS", "GEMINI_MODEL"), "gemini-pro"),
+    "openai": (_call_openai, "OPENAI_API_KEY", "Your_OpenAI_API_Key", ("OPENAI_MODEL",), "gpt-4o"),
+    "deepseek": (_call_deepseek, "DEEPSEEK_API_KEY", "Your_DeepSeek_API_Key", ("DEEPSEEK_MODEL",), "deepseek-chat"),
+    "ollama": (_call_ollama, "OLLAMA_BASE_URL", None, ("OLLAMA_MODEL",), ""),
+}
+
+
+# Providers that can stream their summary; the others are called normally and yield it in one piece.
+_STREAMERS = {
+    "gemini": _stream_gemini,
+    "openai": _stream_openai,
+}
+
+
+def _provider_credential(provider: str) -> str | None:
+    """Return the API key (or base URL) configured for `provider`, or None if it is unknown,
+    missing or still the .env.example placeholder."""
+    if provider not in _PROVIDERS:
+        return None
+    _, credential_env, placeholder, *_ = _PROVIDERS[provider]
+    credential = os.getenv(credential_env)
+    if not credential or credential == placeholder:
+        return None
+    return credential
+
+
+def _provider_models(provider: str) -> list[str]:
+    """Return the configured model list for `provider`, or an empty list if it is not usable
+    (unknown provider, missing/placeholder API key, no base URL)."""
+    if _provider_credential(provider) is None:
+        return []
+    *_, model_envs, default_model = _PROVIDERS[provider]
+    models_env = next((os.getenv(env) for env in model_envs if os.getenv(env)), default_model)
+    return [m.strip() for m in models_env.split(',') if m.strip()]
+
+
+def _call_provider(provider: str, text: str, model: str, target_lang: str | None = None) -> str | None:
+    """Dispatches a single summarization request to `provider` using `model`."""
+    call, credential_env, *_ = _PROVIDERS[provider]
+    return call(text, os.getenv(credential_env), model, target_lang)
+
+
+def _open_summary_stream(provider: str, text: str, model: str, target_lang: str | None = None):
+    """Starts a streaming summary and waits for its first fragment.
+    Returns an iterator over all fragments (the first one included), or None if the provider
+    failed before producing any text, so it can be used as the `call` of _race_providers.
+    """
+    stream = _STREAMERS.get(provider)
+    if stream is None:
+        summary = _call_provider(provider, text, model, target_lang)
+        return iter([summary]) if summary else None
+    _, credential_env, *_ = _PROVIDERS[provider]
+    fragments = stream(text, os.getenv(credential_env), model, target_lang)
+    try:
+        first = next(fragments)
+    except StopIteration:
+        print(f"{provider} ({model}) returned an empty summary.", file=sys.stderr)
+        return None
+    except Exception as e:
+        print(f"{provider} ({model}) streaming error: {e}", file=sys.stderr)
+        return None
+    return itertools.chain([first], fragments)
+
+
+def _llm_fallback_order() -> list[str]:
+    """Return the provider names listed in LLM_FALLBACK_ORDER."""
+    return [p.strip() for p in os.getenv("LLM_FALLBACK_ORDER", "gemini,openai").split(',') if p.strip()]
+
+
+def _choose_model(text_len: int) -> tuple | None:
+    """Route by input size: return the (provider, model) from LLM_FAST_MODEL for texts shorter
+    than LLM_ROUTING_THRESHOLD characters and from LLM_STRONG_MODEL otherwise.
+    Both use the 'provider:model' format; None when the matching variable is not set or names
+    a provider that is not configured or not in LLM_FALLBACK_ORDER.
+    """
+    try:
+        threshold = int(os.getenv("LLM_ROUTING_THRESHOLD", "2000"))
+    except ValueError:
+        threshold = 2000
+    tier = "fast" if text_len < threshold else "strong"
+    env = "LLM_FAST_MODEL" if tier == "fast" else "LLM_STRONG_MODEL"
+    value = os.getenv(env, "").strip()
+    if ':' not in value:
+        return None
+    provider, model = value.split(':', 1)
+    if provider not in _llm_fallback_order() or not _provider_models(provider):
+        print(f"Ignoring {env}: provider '{provider}' is not configured or not in LLM_FALLBACK_ORDER.", file=sys.stderr)
+        return None
+    print(f"Routing {text_len} characters to the {tier} model: {provider} (model: {model})")
+    return provider, model
+
+
+def _provider_chains(preferred: tuple | None = None) -> list[tuple]:
+    """Return (provider, models) pairs for the usable providers of LLM_FALLBACK_ORDER.
+    The `preferred` provider:model, or else the cached one, is moved to the front.
+    """
+    chains = [(p, models) for p in _llm_fallback_order() if (models := _provider_models(p))]
+
+    if preferred is None:
+        preferred = _read_llm_cache()
+        if preferred:
+            print(f"Trying cached LLM: {preferred[0]} (model: {preferred[1]})")
+    if preferred:
+        preferred_provider, preferred_model = preferred
+        for i, (provider, models) in enumerate(chains):
+            if provider == preferred_provider:
+                chains.pop(i)
+                chains.insert(0, (provider, [preferred_model] + [m for m in models if m != preferred_model]))
+                break
+    return chains
+
+
+def _try_model(provider: str, model: str, call, results: queue.Queue):
+    """Runs a single attempt and always puts (provider, model, result) or None into `results`,
+    so the race never waits for an attempt that died with an exception."""
+    outcome = None
+    try:
+        print(f"Trying {provider} model: {model}")
+        result = call(provider, model)
+        if result:
+            outcome = (provider, model, result)
+    except Exception as e:
+        print(f"{provider} ({model}) error: {e}", file=sys.stderr)
+    finally:
+        results.put(outcome)
+
+
+def _race_providers(chains: list[tuple], call, hedge_delay: float | None = None) -> tuple | None:
+    """Runs every configured model as a hedged request and returns the first (provider, model, result).
+
+    The (provider, model) attempts keep the fallback order: providers as listed, each provider's
+    models in their configured order. The first attempt starts at once; each following one starts
+    after LLM_HEDGE_DELAY seconds, or immediately when every started attempt has already failed.
+    So a healthy first model is usually the only one billed, while a slow or failing one (be it
+    a model of the same provider or another provider) no longer costs its full timeout.
+    Attempts run in daemon threads, so a slow loser does not delay interpreter exit.
+    `hedge_delay` overrides LLM_HEDGE_DELAY.
+    """
+    if hedge_delay is None:
+        try:
+            hedge_delay = float(os.getenv("LLM_HEDGE_DELAY", "3"))
+        except ValueError:
+            hedge_delay = 3.0
+
+    results = queue.Queue()
+    pending = deque((provider, model) for provider, models in chains for model in models)
+    running = 0
+    next_start = time.monotonic()
+    while pending or running:
+        if pending and (running == 0 or time.monotonic() >= next_start):
+            provider, model = pending.popleft()
+            threading.Thread(target=_try_model, args=(provider, model, call, results), daemon=True).start()
+            running += 1
+            next_start = time.monotonic() + hedge_delay
+            continue
+        try:
+            result = results.get(timeout=max(0.0, next_start - time.monotonic()) if pending else None)
+        except queue.Empty:
+            continue
+        running -= 1
+        if result:
+            return result
+    return None
+
+
+def _split_for_map_reduce(text: str, chunk_chars: int) -> list[str]:
+    """Splits text at sentence boundaries into chunks of roughly at most `chunk_chars` characters."""
+    chunks = []
+    current = ""
+    for sentence in _SENTENCE_SPLIT_RE.split(text):
+        if current and len(current) + len(sentence) + 1 > chunk_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _summarize_part(text: str, target_lang: str | None = None) -> str | None:
+    """Summarizes one map-reduce part (or the combined partial summaries).
+    Not hedged: a part routinely takes longer than LLM_HEDGE_DELAY to complete, so hedging would
+    start every configured model for every part. The next model only starts when one fails or
+    times out.
+    """
+    chains = _provider_chains(preferred=_choose_model(len(text)))
+    result = _race_providers(chains, lambda provider, model: _call_provider(provider, text, model, target_lang),
+                             hedge_delay=_LLM_TIMEOUT[1])
+    return result[2] if result else None
+
+
+def _map_reduce_summarize(chunks: list[str], target_lang: str | None) -> str | None:
+    """Summarizes each chunk concurrently (in the source language), then summarizes the
+    joined partial summaries into the final one (translated if `target_lang` is set)."""
+    print(f"Long text: summarizing {len(chunks)} parts in parallel...")
+    with ThreadPoolExecutor(max_workers=_MAP_REDUCE_WORKERS) as pool:
+        partials = [partial for partial in pool.map(_summarize_part, chunks) if partial]
+    if not partials:
+        return None
+    combined = " ".join(partials)
+    # Very many parts can give partial summaries that are themselves too long for one pass
+    if len(combined) > _MAP_REDUCE_THRESHOLD:
+        chunks = _split_for_map_reduce(combined, _MAP_REDUCE_CHUNK_CHARS)
+        if len(chunks) > 1:
+            return _map_reduce_summarize(chunks, target_lang)
+    print(f"Combining {len(partials)} partial summaries...")
+    return _summarize_part(combined, target_lang)
+
+
 def summarize_text(text: str, target_lang: str | None = None) -> str | None:
     """Summarizes text using LLM providers according to the fallback order.
     If `target_lang` is set, request that the summary be produced in that language (single-step summarize+translate).
+
+    Models are raced as hedged requests (see _race_providers), so a slow or failing model
+    no longer adds its full timeout. A model picked by size-based routing
+    (LLM_FAST_MODEL/LLM_STRONG_MODEL) goes first.
+    Summaries are cached on disk by content hash, so repeating a request skips the LLM entirely.
+    Texts longer than _MAP_REDUCE_THRESHOLD characters are summarized in parts (map-reduce).
     """
-    fallback_order = os.getenv("LLM_FALLBACK_ORDER", "gemini,openai").split(',')
-    
-    # First, attempt cached provider:model if present
-    cached = _read_llm_cache()
-    if cached:
-        cached_provider, cached_model = cached
-        if cached_provider in fallback_order:
-            print(f"Trying cached LLM: {cached_provider} (model: {cached_model})")
-            if cached_provider == "gemini":
-                api_key = os.getenv("GEMINI_API_KEY")
-                if api_key and api_key != "Your_Gemini_API_Key":
-                    summary = _call_gemini(text, api_key, cached_model, target_lang)
-                    if summary:
-                        _write_llm_cache(cached_provider, cached_model)
-                        print(f"Summary generated by: {cached_provider} (model: {cached_model})")
-                        return summary
-            elif cached_provider == "openai":
-                api_key = os.getenv("OPENAI_API_KEY")
-                if api_key and api_key != "Your_OpenAI_API_Key":
-                    summary = _call_openai(text, api_key, cached_model, target_lang)
-                    if summary:
-                        _write_llm_cache(cached_provider, cached_model)
-                        print(f"Summary generated by: {cached_provider} (model: {cached_model})")
-                        return summary
-            elif cached_provider == "deepseek":
-                api_key = os.getenv("DEEPSEEK_API_KEY")
-                if api_key and api_key != "Your_DeepSeek_API_Key":
-                    summary = _call_deepseek(text, api_key, cached_model)
-                    if summary:
-                        _write_llm_cache(cached_provider, cached_model)
-                        print(f"Summary generated by: {cached_provider} (model: {cached_model})")
-                        return summary
-            elif cached_provider == "ollama":
-                base = os.getenv("OLLAMA_BASE_URL")
-                if base:
-                    summary = _call_ollama(text, base, cached_model)
-                    if summary:
-                        _write_llm_cache(cached_provider, cached_model)
-                        print(f"Summary generated by: {cached_provider} (model: {cached_model})")
-                        return summary
-
-    # No usable cache or cached attempt failed: iterate providers and provider model lists
-    for provider in fallback_order:
-        summary = None
-        if provider == "gemini":
-            api_key = os.getenv("GEMINI_API_KEY")
-            if api_key and api_key != "Your_Gemini_API_Key":
-                models_env = os.getenv("GEMINI_MODELS")
-                if models_env:
-                    models = [m.strip() for m in models_env.split(',') if m.strip()]
-                else:
-                    single = os.getenv("GEMINI_MODEL", "gemini-pro")
-                    models = [m.strip() for m in single.split(',') if m.strip()]
-
-                for model in models:
-                    print(f"Trying Gemini model: {model}")
-                    summary = _call_gemini(text, api_key, model, target_lang)
-                    if summary:
-                        _write_llm_cache("gemini", model)
-                        print(f"Summary generated by: gemini (model: {model})")
-                        return summary
-
-        elif provider == "openai":
-            api_key = os.getenv("OPENAI_API_KEY")
-            if api_key and api_key != "Your_OpenAI_API_Key":
-                models = [m.strip() for m in os.getenv("OPENAI_MODEL", "gpt-4o").split(',') if m.strip()]
-                for model in models:
-                    print(f"Trying OpenAI model: {model}")
-                    summary = _call_openai(text, api_key, model, target_lang)
-                    if summary:
-                        _write_llm_cache("openai", model)
-                        print(f"Summary generated by: openai (model: {model})")
-                        return summary
-
-        elif provider == "deepseek":
-            api_key = os.getenv("DEEPSEEK_API_KEY")
-            if api_key and api_key != "Your_DeepSeek_API_Key":
-                models = [m.strip() for m in os.getenv("DEEPSEEK_MODEL", "deepseek-chat").split(',') if m.strip()]
-                for model in models:
-                    print(f"Trying DeepSeek model: {model}")
-                    summary = _call_deepseek(text, api_key, model)
-                    if summary:
-                        _write_llm_cache("deepseek", model)
-                        print(f"Summary generated by: deepseek (model: {model})")
-                        return summary
-
-        elif provider == "ollama":
-            base = os.getenv("OLLAMA_BASE_URL")
-            if base:
-                models = [m.strip() for m in os.getenv("OLLAMA_MODEL", "").split(',') if m.strip()]
-                for model in models:
-                    print(f"Trying Ollama model: {model}")
-                    summary = _call_ollama(text, base, model)
-                    if summary:
-                        _write_llm_cache("ollama", model)
-                        print(f"Summary generated by: ollama (model: {model})")
-                        return summary
-
-        # ... (other providers)
-
-        if summary:
-            print(f"Summary generated by: {provider}")
-            return summary
-            
+    cache_key = _cache_key("summary", target_lang or "", _normalize_for_cache(text))
+    summary = _cache_get(cache_key)
+    if summary:
+        print("Summary loaded from cache.")
+        return summary
+
+    if len(text) > _MAP_REDUCE_THRESHOLD:
+        chunks = _split_for_map_reduce(text, _MAP_REDUCE_CHUNK_CHARS)
+        # A single oversized sentence cannot be split further: send it as is
+        if len(chunks) > 1:
+            summary = _map_reduce_summarize(chunks, target_lang)
+            if summary:
+                _cache_put(cache_key, summary, _LLM_CACHE_TTL)
+                return summary
+            print("Failed to get summary from any configured LLM.", file=sys.stderr)
+            return None
+
+    chains = _provider_chains(preferred=_choose_model(len(text)))
+    result = _race_providers(chains, lambda provider, model: _call_provider(provider, text, model, target_lang))
+    if result:
+        provider, model, summary = result
+        _write_llm_cache(provider, model)
+        _cache_put(cache_key, summary, _LLM_CACHE_TTL)
+        print(f"Summary generated by: {provider} (model: {model})")
+        return summary
+
     print("Failed to get summary from any configured LLM.", file=sys.stderr)
     return None
 
 
-def translate_text(text: str, target_lang: str) -> str | None:
-    """Translates text to target_lang using available LLM providers.
-    Tries cached provider:model first, then falls back to provider model lists.
+def _sentences_from_fragments(fragments, parts: list[str]):
+    """Reassembles streamed text fragments into complete sentences as soon as they end.
+    Every fragment is also appended to `parts`, so the caller can rebuild the full text."""
+    buffer = ""
+    for fragment in fragments:
+        parts.append(fragment)
+        buffer += fragment
+        # A sentence is complete once whitespace follows its terminator; the tail stays buffered
+        *complete, buffer = _SENTENCE_SPLIT_RE.split(buffer)
+        for sentence in complete:
+            if sentence.strip():
+                yield sentence
+    if buffer.strip():
+        yield buffer
+
+
+def summarize_text_stream(text: str, target_lang: str | None = None):
+    """Like summarize_text, but yields the cleaned summary sentence by sentence while the LLM
+    is still generating it, so speech synthesis can start after the first sentence.
+
+    Models are raced on their first streamed fragment. Cached summaries and map-reduce
+    summaries (long texts) are produced in full first and then yielded per sentence.
+    The summary is cached only when the stream completes.
     """
-    fallback_order = os.getenv("LLM_FALLBACK_ORDER", "gemini,openai").split(',')
-
-    # Try cached provider:model first
-    cached = _read_llm_cache()
-    if cached:
-        provider, model = cached
-        print(f"Trying cached LLM for translation: {provider} (model: {model})")
-        if provider == "openai":
-            api_key = os.getenv("OPENAI_API_KEY")
-            if api_key and api_key != "Your_OpenAI_API_Key":
-                trans = _translate_openai(text, api_key, model, target_lang)
-                if trans:
-                    return trans
-        elif provider == "gemini":
-            api_key = os.getenv("GEMINI_API_KEY")
-            if api_key and api_key != "Your_Gemini_API_Key":
-                trans = _translate_gemini(text, api_key, model, target_lang)
-                if trans:
-                    return trans
-
-    # No cache or failed: iterate providers
-    for provider in fallback_order:
-        if provider == "openai":
-            api_key = os.getenv("OPENAI_API_KEY")
-            if api_key and api_key != "Your_OpenAI_API_Key":
-                models = [m.strip() for m in os.getenv("OPENAI_MODEL", "gpt-4o").split(',') if m.strip()]
-                for model in models:
-                    print(f"Trying OpenAI model for translation: {model}")
-                    trans = _translate_openai(text, api_key, model, target_lang)
-                    if trans:
-                        _write_llm_cache("openai", model)
-                        return trans
-        elif provider == "gemini":
-            api_key = os.getenv("GEMINI_API_KEY")
-            if api_key and api_key != "Your_Gemini_API_Key":
-                models_env = os.getenv("GEMINI_MODELS")
-                if models_env:
-                    models = [m.strip() for m in models_env.split(',') if m.strip()]
-                else:
-                    single = os.getenv("GEMINI_MODEL", "gemini-pro")
-                    models = [m.strip() for m in single.split(',') if m.strip()]
-                for model in models:
-                    print(f"Trying Gemini model for translation: {model}")
-                    trans = _translate_gemini(text, api_key, model, target_lang)
-                    if trans:
-                        _write_llm_cache("gemini", model)
-                        return trans
-    print(f"Translation to {target_lang} failed on all configured LLMs.", file=sys.stderr)
-    return None
+    cache_key = _cache_key("summary", target_lang or "", _normalize_for_cache(text))
+    summary = _cache_get(cache_key)
+    if summary:
+        print("Summary loaded from cache.")
+    elif len(text) > _MAP_REDUCE_THRESHOLD:
+        # Every part has to be summarized before the final pass can start
+        summary = summarize_text(text, target_lang)
+        if not summary:
+            return
+    if summary:
+        for sentence in _SENTENCE_SPLIT_RE.split(clean_text(summary)):
+            if sentence:
+                yield sentence
+        return
+
+    chains = _provider_chains(preferred=_choose_model(len(text)))
+    result = _race_providers(chains, lambda provider, model: _open_summary_stream(provider, text, model, target_lang))
+    if not result:
+        print("Failed to get summary from any configured LLM.", file=sys.stderr)
+        return
+    provider, model, fragments = result
+    _write_llm_cache(provider, model)
+    print(f"Summary generated by: {provider} (model: {model})")
+
+    parts = []
+    try:
+        for sentence in _sentences_from_fragments(fragments, parts):
+            sentence = clean_text(sentence)
+            if sentence:
+                yield sentence
+    except Exception as e:
+        print(f"Summary stream from {provider} was interrupted: {e}", file=sys.stderr)
+        return
+    summary = "".join(parts).strip()
+    if summary:
+        _cache_put(cache_key, summary, _LLM_CACHE_TTL)
+
 
 # --- Content Processing ---
 
 def is_url(text: str) -> bool:
-    """Checks if the given text is a valid URL."""
+    """Checks if the given text is a valid http(s) URL."""
+    return _URL_RE.match(text) is not None
+
+def _read_page_cache(url: str) -> dict | None:
+    """Returns the cached page entry for `url` ({body, etag, last_modified, fresh_until}) or None."""
+    cached = _cache_get(_cache_key("page", url))
     try:
-        result = urlparse(text)
-        return all([result.scheme, result.netloc])
+        entry = _json_loads(cached) if cached else None
     except ValueError:
-        return False
+        return None
+    # None when missing, or stored by an older version as plain text
+    return entry if isinstance(entry, dict) else None
 
-def get_content_from_url(url: str) -> str:
-    """Fetches and returns the main content of a webpage using Jina AI Reader."""
-    print(f"Fetching content from: {url} ...")
-    try:
-        response = requests.get(f"{JINA_READER_URL}{url}", timeout=30)
+def _fetch_page(url: str, entry: dict | None) -> str:
+    """Fetches the Jina Reader text of `url` and stores it in the on-disk cache.
+
+    A stale cached `entry` that came with an ETag or Last-Modified header is revalidated with
+    a conditional GET and reused on 304 Not Modified; pages without validators are simply
+    fetched again. Fresh entries are served by the caller without calling this at all.
+    """
+    cache_key = _cache_key("page", url)
+    headers = {}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    with _timed("jina"):
+        response = _get_session().get(f"{JINA_READER_URL}{url}", headers=headers, timeout=_HTTP_TIMEOUT)
+    if response.status_code == 304 and entry:
+        print("Page content not modified, loaded from cache.")
+        body = entry["body"]
+    else:
         response.raise_for_status()
-        
-        full_content = response.text
-        print("\n--- Fetched Content (Full) ---")
-        print(full_content)
-        print("--- End of Content ---\n")
-
-        lines = full_content.split('\n')
-        meaningful_lines = [line.strip() for line in lines if len(line.strip()) > 40]
-        potential_content = [line for line in meaningful_lines if len(line.split()) > 5 and line.endswith('.')]
-        
-        if not potential_content:
-            parts = full_content.split('\n\n', 2)
-            return max(parts, key=len) if len(parts) > 1 else full_content
+        body = response.text
+
+    etag = response.headers.get("ETag") or (entry or {}).get("etag")
+    last_modified = response.headers.get("Last-Modified") or (entry or {}).get("last_modified")
+    entry = {"body": body, "etag": etag, "last_modified": last_modified,
+             "fresh_until": time.time() + _PAGE_CACHE_TTL}
+    ttl = _PAGE_REVALIDATE_TTL if etag or last_modified else _PAGE_CACHE_TTL
+    _cache_put(cache_key, _json_dumps(entry).decode(), ttl)
+    return body
+
+def _compress_for_llm(text: str) -> str:
+    """Reduces page text before it is sent to an LLM: drops boilerplate lines, repeated
+    paragraphs and lines (compared by a digest of their words), and optionally truncates the
+    result to LLM_MAX_INPUT_CHARS at a sentence boundary. Expects text with its line breaks,
+    i.e. before clean_text(). For URL input get_content_from_url() has already dropped short
+    lines and lines not ending in "." (which covers most boilerplate), so there this mostly
+    deduplicates and truncates; the boilerplate pass matters for files and piped text.
+    """
+    seen = set()
+    kept = []
+    for raw in text.split('\n'):
+        line = raw.strip()
+        if not line:
+            if kept and kept[-1]:
+                kept.append("")
+            continue
+        if len(line) <= _BOILERPLATE_MAX_LEN and _BOILERPLATE_RE.match(line):
+            continue
+        digest = hashlib.blake2b(_normalize_for_cache(line).encode(), digest_size=8).digest()
+        if digest in seen:
+            continue
+        seen.add(digest)
+        kept.append(line)
+    compressed = "\n".join(kept).strip()
+    if not compressed:
+        return text  # nothing but boilerplate: better to let the LLM see all of it
+
+    try:
+        max_chars = int(os.getenv("LLM_MAX_INPUT_CHARS", "0"))
+    except ValueError:
+        max_chars = 0
+    if 0 < max_chars < len(compressed):
+        cut = max(compressed.rfind(". ", 0, max_chars), compressed.rfind(".\n", 0, max_chars))
+        compressed = compressed[:cut + 1] if cut > 0 else compressed[:max_chars]
 
-        return "\n\n".join(potential_content)
+    if len(compressed) < len(text.strip()):
+        print(f"Text for the LLM reduced from {len(text.strip())} to {len(compressed)} characters.")
+    return compressed
 
-    except requests.RequestException as e:
-        return f"Error while fetching URL: {e}"
+def get_content_from_url(url: str) -> str:
+    """Fetches and returns the main content of a webpage using Jina AI Reader.
+    A cached page is reused without any request (or import of `requests`) for _PAGE_CACHE_TTL.
+    """
+    print(f"Fetching content from: {url} ...")
+    entry = _read_page_cache(url)
+    if entry and entry["fresh_until"] > time.time():
+        print("Page content loaded from cache.")
+        full_content = entry["body"]
+    else:
+        import requests
+        try:
+            full_content = _fetch_page(url, entry)
+        except requests.RequestException as e:
+            return f"Error while fetching URL: {e}"
+
+    if _env_flag("SPEAKER_DEBUG"):
+        # Pages can be hundreds of KB: dump them with a single write, and only on request
+        sys.stdout.flush()
+        sys.stdout.buffer.write(b"\n--- Fetched Content (Full) ---\n" + full_content.encode()
+                                + b"\n--- End of Content ---\n\n")
+        sys.stdout.buffer.flush()
+
+    # Single pass over the lines, cheapest checks first: the word split only runs
+    # for long lines that already end with a period
+    potential_content = [line for raw in full_content.split('\n')
+                         if len(line := raw.strip()) > 40 and line.endswith('.') and len(line.split()) > 5]
+    
+    if not potential_content:
+        parts = full_content.split('\n\n', 2)
+        return max(parts, key=len) if len(parts) > 1 else full_content
+
+    return "\n\n".join(potential_content)
 
 # --- TTS (Text-to-Speech) Logic ---
 
-def _tts_gemini(text: str, temp_filename: str) -> bool:
-    """Generates speech using Google Cloud TTS API (treated as Gemini TTS)."""
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key or api_key == "Your_Gemini_API_Key":
+def _stream_audio_content(chunks, out) -> int:
+    """Incrementally decodes the base64 `audioContent` field of a streamed TTS JSON response
+    and writes the MP3 bytes to `out` as they arrive. Returns the number of bytes written.
+    """
+    marker = b'"audioContent"'
+    buf = b""
+    in_audio = False
+    written = 0
+    for chunk in chunks:
+        buf += chunk
+        if not in_audio:
+            idx = buf.find(marker)
+            if idx < 0:
+                # Keep a tail in case the marker is split between two chunks
+                buf = buf[-len(marker):]
+                continue
+            quote = buf.find(b'"', idx + len(marker))
+            if quote < 0:
+                buf = buf[idx:]
+                continue
+            buf = buf[quote + 1:]
+            in_audio = True
+
+        end = buf.find(b'"')
+        data = buf if end < 0 else buf[:end]
+        # base64 decodes in 4-character groups; carry the remainder over to the next chunk
+        usable = len(data) if end >= 0 else len(data) - len(data) % 4
+        if usable:
+            # a2b_base64 is the C primitive behind base64.b64decode, minus its wrappers
+            audio = binascii.a2b_base64(data[:usable])
+            out.write(audio)
+            written += len(audio)
+        if end >= 0:
+            break
+        buf = data[usable:]
+    return written
+
+def _get_tts_grpc_client(api_key: str):
+    """Return a shared gRPC TextToSpeechClient, or None if google-cloud-texttospeech is not installed
+    or the client cannot be created."""
+    global _TTS_GRPC_CLIENT
+    try:
+        from google.cloud import texttospeech
+    except ImportError:
+        return None
+    with _TTS_GRPC_LOCK:
+        if _TTS_GRPC_CLIENT is None:
+            try:
+                _TTS_GRPC_CLIENT = texttospeech.TextToSpeechClient(client_options={"api_key": api_key})
+            except Exception as e:
+                # e.g. google-api-core too old for api_key client options: use the REST API,
+                # and remember the failure so it is not retried (and logged) for every sentence
+                print(f"Google TTS gRPC client unavailable, using REST: {e}", file=sys.stderr)
+                _TTS_GRPC_CLIENT = False
+    return _TTS_GRPC_CLIENT or None
+
+def _tts_gemini_grpc(text: str, out, client) -> bool:
+    """Generates speech through the gRPC Cloud TTS client.
+    The audio arrives as raw MP3 bytes, without the base64-in-JSON wrapping of the REST API.
+    """
+    from google.cloud import texttospeech
+    print("Attempting to use Google TTS engine (Gemini/Cloud, gRPC)...")
+    try:
+        with _timed("tts gemini (grpc)"):
+            response = client.synthesize_speech(
+                input=texttospeech.SynthesisInput(text=text),
+                voice=texttospeech.VoiceSelectionParams(language_code=_TTS_VOICE["languageCode"], name=_TTS_VOICE["name"]),
+                audio_config=texttospeech.AudioConfig(audio_encoding=texttospeech.AudioEncoding.MP3),
+            )
+        if not response.audio_content:
+            print("Google TTS Error: No audio content in response.", file=sys.stderr)
+            return False
+        out.write(response.audio_content)
+        return True
+    except Exception as e:
+        print(f"Google TTS Error: {e}", file=sys.stderr)
+        return False
+
+def _tts_gemini(text: str, out) -> bool:
+    """Generates speech using Google Cloud TTS API (treated as Gemini TTS).
+    Uses the gRPC client when google-cloud-texttospeech is installed; otherwise the REST
+    response is streamed and the MP3 audio is written to `out` while it is still downloading.
+    """
+    api_key = _provider_credential("gemini")
+    if api_key is None:
         return False
+
+    client = _get_tts_grpc_client(api_key)
+    if client is not None:
+        return _tts_gemini_grpc(text, out, client)
         
     print("Attempting to use Google TTS engine (Gemini/Cloud)...")
     url = f"https://texttospeech.googleapis.com/v1/text:synthesize?key={api_key}"
@@ -439,22 +1098,18 @@ def _tts_gemini(text: str, temp_filename: str) -> bool:
     
     # Note: Using the standard Google Cloud TTS API. If a dedicated
     # Gemini TTS endpoint becomes available, this logic should be updated.
-    data = {
-        "input": {"text": text},
-        "voice": {"languageCode": "pl-PL", "name": "pl-PL-Wavenet-A"},
-        "audioConfig": {"audioEncoding": "MP3"}
-    }
+    data = {"input": {"text": text}, "voice": _TTS_VOICE, "audioConfig": _TTS_AUDIO_CONFIG}
     
     try:
-        response = requests.post(url, headers=headers, json=data, timeout=30)
-        response.raise_for_status()
-        audio_content = response.json().get("audioContent")
-        if not audio_content:
+        # Timed up to the response headers: the audio is then written at the player's pace
+        with _timed("tts gemini (stream start)"):
+            response = _get_session().post(url, headers=headers, data=_json_dumps(data), timeout=_HTTP_TIMEOUT, stream=True)
+        with response:
+            response.raise_for_status()
+            written = _stream_audio_content(response.iter_content(4096), out)
+        if not written:
             print("Google TTS Error: No audio content in response.", file=sys.stderr)
             return False
-
-        with open(temp_filename, "wb") as f:
-            f.write(base64.b64decode(audio_content))
         return True
 
     except Exception as e:
@@ -502,12 +1157,12 @@ def _detect_language(text: str) -> str:
     # Default to English
     return 'en'
 
-def _tts_gtts(text: str, temp_filename: str, tts_lang: str | None = None) -> bool:
+def _tts_gtts(text: str, out, tts_lang: str | None = None) -> bool:
     """Generates speech using the gTTS library (fallback).
 
     Args:
         text: Text to convert to speech
-        temp_filename: Where to save the audio file
+        out: Binary stream the MP3 audio is written to (parts are written as they are fetched)
         tts_lang: Optional language code. If None, auto-detects from text.
     """
     from gtts import gTTS
@@ -522,47 +1177,131 @@ def _tts_gtts(text: str, temp_filename: str, tts_lang: str | None = None) -> boo
 
     try:
         tts = gTTS(text, lang=tts_lang)
-        tts.save(temp_filename)
+        with _timed("tts gtts"):
+            tts.write_to_fp(out)
         return True
     except Exception as e:
         print(f"gTTS Error: {e}", file=sys.stderr)
         return False
 
-def read_aloud(text: str, tts_lang: str | None = None):
+def _split_sentences(text: str, max_chars: int = 250) -> list[str]:
+    """Splits text into sentence-sized chunks for pipelined TTS.
+    The first chunk is always a single sentence so that audio starts quickly; the following
+    sentences are grouped up to `max_chars` to keep the number of TTS requests low.
+    """
+    sentences = [s for s in _SENTENCE_SPLIT_RE.split(text.strip()) if s]
+    chunks = sentences[:1]
+    for sentence in sentences[1:]:
+        if len(chunks) > 1 and len(chunks[-1]) + len(sentence) < max_chars:
+            chunks[-1] += " " + sentence
+        else:
+            chunks.append(sentence)
+    return chunks
+
+def _tts_fallback_order() -> list[str]:
+    """Return the TTS engine names listed in TTS_FALLBACK_ORDER."""
+    return [p.strip() for p in os.getenv("TTS_FALLBACK_ORDER", "gtts,gemini").split(',') if p.strip()]
+
+def _synthesize(text: str, out, tts_lang: str | None, fallback_order: list[str]) -> bool:
+    """Writes speech for `text` to `out` using the first TTS engine that succeeds."""
+    for provider in fallback_order:
+        if provider == "gemini":
+            if _tts_gemini(text, out):
+                return True
+        elif provider == "gtts":
+            if _tts_gtts(text, out, tts_lang):
+                return True
+    return False
+
+def _synthesize_bytes(text: str, tts_lang: str | None, fallback_order: list[str]) -> bytes | None:
+    """Synthesizes `text` into an in-memory MP3 (used by the background TTS workers)."""
+    buf = io.BytesIO()
+    return buf.getvalue() if _synthesize(text, buf, tts_lang, fallback_order) else None
+
+def read_aloud(text, tts_lang: str | None = None):
     """Converts text to speech and plays it, using configured TTS engines.
 
+    The text is split into sentences. The first one is streamed straight into mpg123's
+    stdin while the following ones are synthesized in background threads (a few ahead of
+    playback) and fed to the player in order, so the first sound comes after roughly one
+    sentence of synthesis instead of the whole text.
+
     Args:
-        text: Text to read aloud
+        text: Text to read aloud, or an iterable of sentences that may still be produced
+              while reading (e.g. a streamed summary from summarize_text_stream)
         tts_lang: Optional language code for TTS. If provided, uses this language.
-                  If None, auto-detects language from text.
+                  If None, auto-detects language from text (only from the first sentence
+                  when given an iterable, so callers streaming text should pass it).
     """
-    if not text.strip():
+    chunks = iter(_split_sentences(text) if isinstance(text, str) else text)
+    first = next(chunks, None)
+    if not first:
         print("No text to read.")
         return
 
     print("Preparing speech...")
-    fallback_order = os.getenv("TTS_FALLBACK_ORDER", "gtts,gemini").split(',')
+    fallback_order = _tts_fallback_order()
+
+    # Detect the language once for the whole text, not per sentence
+    if not tts_lang:
+        tts_lang = _detect_language(text if isinstance(text, str) else first)
+        print(f"Auto-detected language: {tts_lang}")
 
-    temp_file = None
+    pool = ThreadPoolExecutor(max_workers=_TTS_WORKERS)
+    pending = queue.Queue()
+    lookahead = threading.Semaphore(_TTS_WORKERS)
+    stop = threading.Event()
+
+    def feed():
+        # Pulls the next sentences (possibly waiting for the LLM) and starts synthesizing
+        # them, at most _TTS_WORKERS ahead of playback.
+        try:
+            for chunk in chunks:
+                lookahead.acquire()
+                if stop.is_set():
+                    return
+                pending.put(pool.submit(_synthesize_bytes, chunk, tts_lang, fallback_order))
+        except RuntimeError:
+            pass  # the pool was shut down because playback ended early
+        finally:
+            pending.put(None)
+
+    player = None
     success = False
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as fp:
-            temp_file = fp.name
-
-        for provider in fallback_order:
-            if provider == "gemini":
-                if _tts_gemini(text, temp_file):
-                    success = True
-                    break
-            elif provider == "gtts":
-                if _tts_gtts(text, temp_file, tts_lang):
-                    success = True
-                    break
-        
+        # mpg123 resyncs on the next frame header, so a later engine can take over
+        # the same player if an earlier one fails midway.
+        player = subprocess.Popen(["mpg123", "-q", "-"], stdin=subprocess.PIPE,
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        # Start synthesizing the next sentences before the first one is played
+        threading.Thread(target=feed, daemon=True).start()
+
+        print("Playing audio...")
+        success = _synthesize(first, player.stdin, tts_lang, fallback_order)
+        skipped = 0
+        while success:
+            # Futures are consumed in submission order, so playback order is preserved
+            # even when a shorter sentence finishes synthesizing first.
+            future = pending.get()
+            if future is None:
+                break
+            lookahead.release()
+            audio = future.result()
+            if audio is None:
+                # Skip the sentence rather than cutting off the audio already queued in the player
+                skipped += 1
+                continue
+            player.stdin.write(audio)
+            player.stdin.flush()
+
         if success:
-            print("Playing audio...")
-            player_command = ["mpg123", "-q", temp_file]
-            subprocess.run(player_command, check=True, capture_output=True)
+            if skipped:
+                print(f"Skipped {skipped} sentence(s) that no TTS engine could synthesize.", file=sys.stderr)
+            player.stdin.close()
+            returncode = player.wait()
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, player.args)
         else:
             print("All configured TTS engines failed.", file=sys.stderr)
 
@@ -570,28 +1309,67 @@ def read_aloud(text: str, tts_lang: str | None = None):
         print(f"An error occurred during speech generation or playback: {e}", file=sys.stderr)
         print("Please ensure 'mpg123' is installed (`sudo apt install mpg123`).", file=sys.stderr)
     finally:
-        if temp_file and os.path.exists(temp_file):
-            os.remove(temp_file)
-            print("Temporary file deleted.")
+        stop.set()
+        lookahead.release()
+        pool.shutdown(wait=False, cancel_futures=True)
+        if player and player.poll() is None:
+            player.kill()
+            player.wait()
 
 def clean_text(text: str) -> str:
     """Cleans text of common problematic characters and excessive whitespace."""
-    replacements = {
-        '\u201c': '"',  # “
-        '\u201d': '"',  # ”
-        '\u2018': "'",  # ‘
-        '\u2019': "'",  # ’
-        '\u2013': '-',  # – (en-dash)
-        '\u2014': '-',  # — (em-dash)
-        '\u00a0': ' ',  # non-breaking space
-    }
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    
     # Replace multiple whitespace/newline characters with a single space
-    text = re.sub(r'\s+', ' ', text)
-    
-    return text.strip()
+    return _WS_RE.sub(' ', text.translate(_CLEAN_TRANS_TABLE)).strip()
+
+# Base URLs of the HTTP APIs contacted later in a run, warmed up by _warm_up_connections()
+_LLM_WARM_UP_URLS = {
+    "gemini": "https://generativelanguage.googleapis.com/",
+    "openai": "https://api.openai.com/",
+}
+_TTS_WARM_UP_URL = "https://texttospeech.googleapis.com/"
+# gTTS opens its own connections, so only its DNS lookup can be done ahead of time
+_GTTS_HOST = "translate.google.com"
+
+def _warm_up(url: str):
+    """Opens a pooled connection to `url` with a cheap HEAD request; failures are ignored."""
+    try:
+        _get_session().head(url, timeout=(_CONNECT_TIMEOUT, 5))
+    except Exception:
+        pass
+
+def _warm_up_tts_gemini(api_key: str):
+    """Creates the gRPC TTS client if available, otherwise warms up the REST endpoint."""
+    if _get_tts_grpc_client(api_key) is None:
+        _warm_up(_TTS_WARM_UP_URL)
+
+def _resolve_host(host: str):
+    """Resolves `host` so that a later connection finds the answer in the resolver cache."""
+    import socket
+    try:
+        socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+    except OSError:
+        pass
+
+def _warm_up_connections(summarize: bool):
+    """Starts the DNS lookups and TCP/TLS handshakes for the configured LLM and TTS hosts in
+    daemon threads, so they overlap the page fetch instead of delaying the first real request.
+    Connections opened through the shared session stay in its pool and are reused.
+    """
+    tasks = []
+    if summarize:
+        for provider in _llm_fallback_order():
+            if provider in _LLM_WARM_UP_URLS and _provider_models(provider):
+                tasks.append((_warm_up, _LLM_WARM_UP_URLS[provider]))
+    # Only the first usable TTS engine: the others are contacted only if it fails
+    for engine in _tts_fallback_order():
+        if engine == "gtts":
+            tasks.append((_resolve_host, _GTTS_HOST))
+            break
+        if engine == "gemini" and (api_key := _provider_credential("gemini")) is not None:
+            tasks.append((_warm_up_tts_gemini, api_key))
+            break
+    for target, arg in tasks:
+        threading.Thread(target=target, args=(arg,), daemon=True).start()
 
 def main():
     """Main script function."""
@@ -606,7 +1384,12 @@ def main():
     parser.add_argument(
         "-t", "--translate",
         action="store_true",
-        help="After summarization, translate the summary to the language set in TRANSLATE_TO_LANG in .env.",
+        help="With -s, produce the summary directly in the language set in TRANSLATE_TO_LANG in .env (one LLM call).",
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Print the full page content fetched from Jina Reader (same as SPEAKER_DEBUG=1).",
     )
     parser.add_argument(
         "text_parts",
@@ -616,6 +1399,14 @@ def main():
     )
     args = parser.parse_args()
 
+    _load_env()
+    if _env_flag("SPEAKER_PROFILE"):
+        atexit.register(_print_latency_report)
+    if args.verbose:
+        os.environ["SPEAKER_DEBUG"] = "1"
+
+    _warm_up_connections(args.summarize)
+
     # Join all text parts into a single string
     content_to_process = " ".join(args.text_parts)
     
@@ -633,11 +1424,20 @@ def main():
         target_lang = None
         if args.translate:
             target_lang = os.getenv("TRANSLATE_TO_LANG", "en")
-        summary = summarize_text(cleaned_content, target_lang)
-        if summary:
-            # The summary might also need cleaning
-            # If translation was used, pass target_lang to TTS so it reads in the correct language
-            read_aloud(clean_text(summary), tts_lang=target_lang)
+        # Boilerplate is removed while the line breaks are still there, before clean_text()
+        llm_content = clean_text(_compress_for_llm(content_for_reading))
+        # The summary is read while it is still being generated; wait only for its first sentence
+        sentences = summarize_text_stream(llm_content, target_lang)
+        first_sentence = next(sentences, None)
+        if first_sentence:
+            # If translation was used, pass target_lang to TTS so it reads in the correct language.
+            # Otherwise the summary is in the input language: detect it from the whole input,
+            # as the first summary sentence alone is often too short to detect reliably.
+            tts_lang = target_lang
+            if not tts_lang:
+                tts_lang = _detect_language(cleaned_content)
+                print(f"Auto-detected language: {tts_lang}")
+            read_aloud(itertools.chain([first_sentence], sentences), tts_lang=tts_lang)
         else:
             print("Summarization failed. Reading original text.", file=sys.stderr)
             # Original content - auto-detect language